@@ -97,6 +97,13 @@ for DX_ID in $DX_ATTACHMENT_IDS; do
 done
 
 # Associations & Propagations
+# Besides one file per route table, each response is appended to a JSON Lines
+# manifest (tgw-rt-{associations,propagations,routes}.jsonl) tagged with its
+# route table ID, so generators can load all route tables in a single read.
+for KIND in associations propagations routes; do
+  : > "$OUTPUT_DIR/tgw-rt-$KIND.jsonl"
+done
+
 for TGW_ID in $TGW_IDS; do
   RT_IDS=$(aws ec2 describe-transit-gateway-route-tables $PROFILE_ARG --region "$REGION" \
     --filters "Name=transit-gateway-id,Values=$TGW_ID" \
@@ -110,6 +117,11 @@ for TGW_ID in $TGW_IDS; do
     aws ec2 search-transit-gateway-routes $PROFILE_ARG --region "$REGION" \
       --transit-gateway-route-table-id "$RT_ID" \
       --filters "Name=state,Values=active,blackhole" --output json > "$OUTPUT_DIR/tgw-rt-routes-$RT_ID.json"
+
+    for KIND in associations propagations routes; do
+      jq -c --arg rt "$RT_ID" '. + {TransitGatewayRouteTableId: $rt}' \
+        "$OUTPUT_DIR/tgw-rt-$KIND-$RT_ID.json" >> "$OUTPUT_DIR/tgw-rt-$KIND.jsonl"
+    done
   done
 done
 
@@ -10,63 +10,194 @@ Supports multi-account, multi-region, and multi-TGW environments.
 Requirements: Python 3.8+
 """
 
-import json
-import re
+import os
+import shlex
+import sys
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Callable, Dict, Iterator, List, Any
 
 # Constants
 DEFAULT_INPUT_DIR = './output'
 DEFAULT_OUTPUT_DIR = './terraform'
+DEFAULT_MODE = 'per-rt'
+IMPORT_MODES = ('per-rt', 'combined')  # One import.sh per route table, or one import-all.sh per TGW
+TGW_RT_PREFIX = 'tgw-rt-'  # Stripped from route table names for directory names
+KEY_TRANSLATION = str.maketrans('- :', '___')  # Characters not allowed in map keys
+CIDR_TRANSLATION = str.maketrans('/.:', '___')  # Characters not allowed in route keys
+DIRNAME_TRANSLATION = str.maketrans(' _', '--')  # Characters replaced in directory names
+MAX_READ_WORKERS = 16  # Threads used to read per-route-table JSON files
+ROUTE_TABLE_FILE_KINDS = ('associations', 'propagations', 'routes')  # tgw-rt-{kind}-{rt_id}.json
+
+# import.sh templates
+SH_PREAMBLE = """#!/bin/bash
+set -euo pipefail
+
+"""
+
+SH_FOOTER = """echo '✓ Import completed'
+"""
+
+TGW_IMPORT_SH = SH_PREAMBLE + """echo 'Importing Transit Gateway...'
+terraform import aws_ec2_transit_gateway.this {tgw_id}
+
+{sections}""" + SH_FOOTER
+
+RT_IMPORT_SH = SH_PREAMBLE + """echo {message}
+
+# Import Route Table
+terraform import aws_ec2_transit_gateway_route_table.this {rt_id}
+
+{sections}""" + SH_FOOTER
+
+# Combined mode: all route table imports of a TGW in tgw-{name}/import-all.sh
+IMPORT_ALL_SH = SH_PREAMBLE + """# Route table directories are resolved relative to this script
+cd "$(dirname "$0")"
+
+{sections}"""
+
+IMPORT_ALL_RT_SECTION = """pushd {rt_path} > /dev/null
+{script}popd > /dev/null
+
+"""
+
+VPC_ATTACHMENT_IMPORT = "terraform import 'aws_ec2_transit_gateway_vpc_attachment.this[\"{key}\"]' {att_id}"
+PEERING_ATTACHMENT_IMPORT = "terraform import 'aws_ec2_transit_gateway_peering_attachment.this[\"{key}\"]' {att_id}"
+# Association/Propagation ID format: tgw-rtb-xxxxx_tgw-attach-xxxxx
+ASSOCIATION_IMPORT = "terraform import 'aws_ec2_transit_gateway_route_table_association.this[\"{key}\"]' {rt_id}_{att_id}"
+PROPAGATION_IMPORT = "terraform import 'aws_ec2_transit_gateway_route_table_propagation.this[\"{key}\"]' {rt_id}_{att_id}"
+# Route import format: tgw-rtb-xxxxx_destination
+ROUTE_IMPORT = "terraform import 'aws_ec2_transit_gateway_route.this[\"{key}\"]' {rt_id}_{destination}"
+
+
+@lru_cache(maxsize=None)
+def json_parser() -> Callable[[bytes], Any]:
+    """Return the JSON parser, importing it on first use.
+
+    orjson is used when installed, otherwise the standard library json module.
+    """
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:  # Optional: fall back to the standard library parser
+        import json
+        return json.loads
+
+
+@lru_cache(maxsize=None)
+def sanitize_key(name: str) -> str:
+    """Sanitize resource name for use as Terraform map key."""
+    return name.translate(KEY_TRANSLATION).lower()
+
+
+@lru_cache(maxsize=None)
+def make_route_key(destination: str) -> str:
+    """Build Terraform map key of a route from its destination CIDR block."""
+    return f'route_{destination.translate(CIDR_TRANSLATION)}'
+
+
+@lru_cache(maxsize=None)
+def sanitize_dirname(name: str) -> str:
+    """Sanitize route table name for directory name.
+    
+    Examples:
+        tgw-rt-production -> rt-production
+        TGW-RT-Shared -> rt-shared
+    """
+    # Remove tgw-rt- prefix (case insensitive)
+    if name[:len(TGW_RT_PREFIX)].lower() == TGW_RT_PREFIX:
+        name = name[len(TGW_RT_PREFIX):]
+    return name.translate(DIRNAME_TRANSLATION).lower()
 
 
 class ImportCommandsGeneratorV2:
     """Generator for split import commands."""
 
-    def __init__(self, input_dir: str, output_dir: str, account_id: str = None, region: str = None) -> None:
+    def __init__(self, input_dir: str, output_dir: str, account_id: str = None, region: str = None,
+                 mode: str = DEFAULT_MODE) -> None:
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir)
         self.account_id = account_id
         self.region = region
+        self.mode = mode
         self.selected_tgw_id = None  # Will be set when selecting TGW
 
+    def parse_json(self, data: bytes) -> Any:
+        """Parse a JSON document, using orjson when it is installed."""
+        return json_parser()(data)
+
+    def read_json(self, filepath: str) -> dict:
+        """Parse a JSON file."""
+        with open(filepath, 'rb') as f:
+            return self.parse_json(f.read())
+
+    @cached_property
+    def input_files(self) -> Dict[str, os.DirEntry]:
+        """Files in input directory, listed once and indexed by filename."""
+        try:
+            with os.scandir(self.input_dir) as entries:
+                return {entry.name: entry for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            return {}
+
     def load_json(self, filename: str) -> dict:
         """Load JSON file from input directory."""
-        filepath = self.input_dir / filename
-        if not filepath.exists():
+        if filename not in self.input_files:
             return {}
-        with open(filepath, encoding='utf-8') as f:
-            return json.load(f)
-
-    def get_tag_value(self, tags: List[dict] | None, key: str, default: str = "") -> str:
-        """Extract tag value from AWS tags list."""
-        if not tags:
-            return default
-        for tag in tags:
-            if tag.get('Key') == key:
-                return tag.get('Value', default)
-        return default
-
-    def sanitize_key(self, name: str) -> str:
-        """Sanitize resource name for use as Terraform map key."""
-        return name.replace('-', '_').replace(' ', '_').replace(':', '_').lower()
-
-    def sanitize_dirname(self, name: str) -> str:
-        """Sanitize route table name for directory name.
-        
-        Examples:
-            tgw-rt-production -> rt-production
-            TGW-RT-Shared -> rt-shared
-        """
-        # Remove tgw-rt- prefix (case insensitive)
-        name = re.sub(r'^tgw-rt-', '', name, flags=re.IGNORECASE)
-        return name.replace(' ', '-').replace('_', '-').lower()
+        return self.read_json(self.input_files[filename].path)
+
+    def load_jsonl(self, filename: str) -> Iterator[dict]:
+        """Iterate records of a JSON Lines file from input directory."""
+        if filename not in self.input_files:
+            return
+        with open(self.input_files[filename].path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield self.parse_json(line)
+
+    @cached_property
+    def attachments_data(self) -> dict:
+        """Contents of tgw-attachments.json, parsed once and shared by all TGWs."""
+        return self.load_json('tgw-attachments.json')
+
+    @cached_property
+    def route_table_files(self) -> Dict[str, str]:
+        """Per-route-table JSON files in input directory, indexed by filename."""
+        return {name: entry.path for name, entry in self.input_files.items()
+                if name.startswith('tgw-rt-') and name.endswith('.json')}
+
+    @cached_property
+    def attachments_by_tgw(self) -> Dict[str, List[dict]]:
+        """Attachments from tgw-attachments.json grouped by Transit Gateway ID."""
+        attachments = {}
+        for attachment in self.attachments_data.get('TransitGatewayAttachments', []):
+            attachments.setdefault(attachment.get('TransitGatewayId'), []).append(attachment)
+        return attachments
 
-    def generate_tgw_import(self, tgw: dict) -> str:
+    @cached_property
+    def route_tables_by_tgw(self) -> Dict[str, List[dict]]:
+        """Route tables from tgw-route-tables.json grouped by Transit Gateway ID."""
+        route_tables = {}
+        for rt in self.load_json('tgw-route-tables.json').get('TransitGatewayRouteTables', []):
+            route_tables.setdefault(rt.get('TransitGatewayId'), []).append(rt)
+        return route_tables
+
+    def tags_to_dict(self, tags: List[dict] | None) -> Dict[str, str]:
+        """Convert AWS tags list to a {Key: Value} dict."""
+        try:
+            # AWS tags always have both Key and Value
+            return {tag['Key']: tag['Value'] for tag in tags or ()}
+        except KeyError:
+            # Skip incomplete tags so that callers' defaults (such as the resource ID) apply
+            return {tag['Key']: tag['Value'] for tag in tags or () if 'Key' in tag and 'Value' in tag}
+
+    def generate_tgw_import(self, tgw: dict, all_attachments: Dict[str, Any] | None = None) -> str:
         """Generate import.sh for a specific Transit Gateway.
 
         Args:
             tgw: Transit Gateway object from AWS API
+            all_attachments: Attachments of this TGW from collect_all_attachments()
+                (collected here if not provided)
 
         Returns:
             String content of import.sh
@@ -74,34 +205,29 @@ class ImportCommandsGeneratorV2:
         tgw_id = tgw['TransitGatewayId']
         self.selected_tgw_id = tgw_id  # Store selected TGW ID
 
-        lines = ["#!/bin/bash", "set -euo pipefail", ""]
-        lines.append("echo 'Importing Transit Gateway...'")
-        lines.append(f"terraform import aws_ec2_transit_gateway.this {tgw_id}")
-        lines.append("")
-
-        # Import VPC Attachments
-        all_attachments = self.collect_all_attachments()
-        vpc_attachments = {k: v for k, v in all_attachments.items() if v['type'] == 'vpc'}
-        peering_attachments = {k: v for k, v in all_attachments.items() if v['type'] == 'peering'}
-
-        if vpc_attachments:
-            lines.append("echo 'Importing VPC Attachments...'")
-            for att_id, att in vpc_attachments.items():
-                att_key = att['key']
-                lines.append(f"terraform import 'aws_ec2_transit_gateway_vpc_attachment.this[\"{att_key}\"]' {att_id}")
-            lines.append("")
-
-        if peering_attachments:
-            lines.append("echo 'Importing Peering Attachments...'")
-            for att_id, att in peering_attachments.items():
-                att_key = att['key']
-                lines.append(f"terraform import 'aws_ec2_transit_gateway_peering_attachment.this[\"{att_key}\"]' {att_id}")
-            lines.append("")
-
-        lines.append("echo '✓ Import completed'")
-        lines.append("")
+        if all_attachments is None:
+            all_attachments = self.collect_all_attachments()
 
-        return '\n'.join(lines)
+        # Partition attachments by type in a single pass
+        attachments_by_type = {}
+        for att_id, att in all_attachments.items():
+            attachments_by_type.setdefault(att['type'], []).append((att_id, att))
+
+        # Import VPC and Peering Attachments
+        sections = [
+            self._script_section(
+                "echo 'Importing VPC Attachments...'",
+                [VPC_ATTACHMENT_IMPORT.format(key=att['key'], att_id=att_id)
+                 for att_id, att in attachments_by_type.get('vpc', [])]
+            ),
+            self._script_section(
+                "echo 'Importing Peering Attachments...'",
+                [PEERING_ATTACHMENT_IMPORT.format(key=att['key'], att_id=att_id)
+                 for att_id, att in attachments_by_type.get('peering', [])]
+            ),
+        ]
+
+        return TGW_IMPORT_SH.format(tgw_id=tgw_id, sections=''.join(sections))
 
     def collect_all_attachments(self) -> Dict[str, Any]:
         """Collect all attachment information indexed by attachment_id.
@@ -110,17 +236,18 @@ class ImportCommandsGeneratorV2:
         """
         attachments = {}
 
-        tgw_attachments_data = self.load_json('tgw-attachments.json')
-
-        for attachment in tgw_attachments_data.get('TransitGatewayAttachments', []):
-            # Filter by selected TGW ID
-            if self.selected_tgw_id and attachment.get('TransitGatewayId') != self.selected_tgw_id:
-                continue
+        # Filter by selected TGW ID
+        if self.selected_tgw_id:
+            tgw_attachments = self.attachments_by_tgw.get(self.selected_tgw_id, [])
+        else:
+            tgw_attachments = self.attachments_data.get('TransitGatewayAttachments', [])
 
+        for attachment in tgw_attachments:
             attachment_id = attachment['TransitGatewayAttachmentId']
             resource_type = attachment.get('ResourceType', '')
-            name = self.get_tag_value(attachment.get('Tags'), 'Name', attachment_id)
-            key = self.sanitize_key(name)
+            tags = self.tags_to_dict(attachment.get('Tags'))
+            name = tags.get('Name', attachment_id)
+            key = sanitize_key(name)
 
             attachments[attachment_id] = {
                 'key': key,
@@ -132,195 +259,252 @@ class ImportCommandsGeneratorV2:
 
         return attachments
 
+    def _script_section(self, header: str, commands: List[str]) -> str:
+        """Format a block of import commands, or nothing if there are none."""
+        if not commands:
+            return ''
+        return header + '\n' + '\n'.join(commands) + '\n\n'
+
+    def _attachment_import_line(self, template: str, key: str, rt_id: str,
+                                rt_attachments: Dict[str, Any]) -> str:
+        """Format an association/propagation import, commented out if the attachment is unknown."""
+        if key in rt_attachments:
+            return template.format(key=key, rt_id=rt_id, att_id=rt_attachments[key]['attachment_id'])
+        return '# ' + template.format(key=key, rt_id=rt_id, att_id='<attachment-id>')
+
     def generate_route_table_import(self, rt_id: str, rt_name: str,
                                      rt_attachments: Dict[str, Any],
                                      associations: List[str],
                                      propagations: List[str],
                                      routes: List[Dict[str, Any]]) -> str:
         """Generate import.sh for a route table."""
-        lines = ["#!/bin/bash", "set -euo pipefail", ""]
-        lines.append(f"echo 'Importing resources for route table: {rt_name}'")
-        lines.append("")
+        # Note: VPC Attachments are managed in the tgw/ directory
+        # Route tables only manage associations to those attachments
+        sections = [
+            self._script_section(
+                "# Import Route Table Associations",
+                [self._attachment_import_line(ASSOCIATION_IMPORT, key, rt_id, rt_attachments)
+                 for key in associations]
+            ),
+            self._script_section(
+                "# Import Route Table Propagations",
+                [self._attachment_import_line(PROPAGATION_IMPORT, key, rt_id, rt_attachments)
+                 for key in propagations]
+            ),
+            self._script_section(
+                "# Import Transit Gateway Routes",
+                [ROUTE_IMPORT.format(key=route['key'], rt_id=rt_id,
+                                     destination=route['destination_cidr_block'])
+                 for route in routes]
+            ),
+        ]
+
+        message = shlex.quote(f'Importing resources for route table: {rt_name}')
+        return RT_IMPORT_SH.format(rt_id=rt_id, message=message, sections=''.join(sections))
+
+    @cached_property
+    def route_table_manifest(self) -> Dict[str, Dict[str, dict]]:
+        """Records from tgw-rt-{kind}.jsonl manifests written by fetch_aws_resources.sh.
+
+        Each record is the per-route-table API response plus its
+        TransitGatewayRouteTableId. Every manifest is parsed once per run and
+        its records are grouped by route table ID, each indexed by the
+        equivalent per-route-table filename so it can stand in for that file.
+        Records without a route table ID are skipped.
+        """
+        records = {}
+        for kind in ROUTE_TABLE_FILE_KINDS:
+            for record in self.load_jsonl(f'tgw-rt-{kind}.jsonl'):
+                rt_id = record.get('TransitGatewayRouteTableId')
+                if rt_id is not None:
+                    records.setdefault(rt_id, {})[f'tgw-rt-{kind}-{rt_id}.json'] = record
+        return records
+
+    def load_route_table_manifest(self, rt_ids: List[str]) -> Dict[str, dict]:
+        """Take the manifest records of route tables, indexed by per-route-table filename.
+
+        Records are removed from route_table_manifest as they are taken, so
+        those of TGWs already generated are released. A manifest record takes
+        precedence over the per-route-table file of the same route table.
+        """
+        records = {}
+        for rt_id in rt_ids:
+            records.update(self.route_table_manifest.pop(rt_id, {}))
+        return records
 
-        # Import route table
-        lines.append("# Import Route Table")
-        lines.append(f"terraform import aws_ec2_transit_gateway_route_table.this {rt_id}")
-        lines.append("")
+    def load_route_table_data(self, rt_ids: List[str]) -> Dict[str, dict]:
+        """Load association, propagation and route files for route tables.
 
-        # Group attachments by type
-        vpc_atts = {k: v for k, v in rt_attachments.items() if v['type'] == 'vpc'}
-        peer_atts = {k: v for k, v in rt_attachments.items() if v['type'] == 'peering'}
-        vpn_atts = {k: v for k, v in rt_attachments.items() if v['type'] == 'vpn'}
-        dx_atts = {k: v for k, v in rt_attachments.items() if v['type'] == 'direct-connect-gateway'}
+        Records from the JSON Lines manifests are used when available. Other
+        files are read concurrently since each route table has its own set of
+        small files. Missing files load as empty dicts without being opened.
 
-        # Note: VPC Attachments are managed in the tgw/ directory
-        # Route tables only manage associations to those attachments
+        Returns:
+            Parsed JSON indexed by filename
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        filenames = [f'tgw-rt-{kind}-{rt_id}.json'
+                     for rt_id in rt_ids
+                     for kind in ROUTE_TABLE_FILE_KINDS]
+        data = self.load_route_table_manifest(rt_ids)
+        pending = [name for name in filenames
+                   if name not in data and name in self.route_table_files]
+        with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as executor:
+            data.update(zip(pending, executor.map(
+                self.read_json, [self.route_table_files[name] for name in pending]
+            )))
+        return {name: data.get(name, {}) for name in filenames}
+
+    def write_script(self, filepath: Path, content: str) -> None:
+        """Write an executable import script."""
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        try:
+            os.fchmod(fd, 0o755)  # Creation mode is masked by umask
+            data = memoryview(content.encode('utf-8'))
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    def generate_imports_for_tgw(self, tgw: dict) -> List[Path]:
+        """Generate the TGW import script and the import scripts of its route tables.
 
-        # Import Associations
-        if associations:
-            lines.append("# Import Route Table Associations")
-            for assoc_key in associations:
-                # Association ID format: tgw-rtb-xxxxx_tgw-attach-xxxxx
-                if assoc_key in rt_attachments:
-                    att_id = rt_attachments[assoc_key]['attachment_id']
-                    lines.append(f"terraform import 'aws_ec2_transit_gateway_route_table_association.this[\"{assoc_key}\"]' {rt_id}_{att_id}")
-                else:
-                    lines.append(f"# terraform import 'aws_ec2_transit_gateway_route_table_association.this[\"{assoc_key}\"]' {rt_id}_<attachment-id>")
-            lines.append("")
-
-        # Import Propagations
-        if propagations:
-            lines.append("# Import Route Table Propagations")
-            for prop_key in propagations:
-                # Propagation ID format: tgw-rtb-xxxxx_tgw-attach-xxxxx
-                if prop_key in rt_attachments:
-                    att_id = rt_attachments[prop_key]['attachment_id']
-                    lines.append(f"terraform import 'aws_ec2_transit_gateway_route_table_propagation.this[\"{prop_key}\"]' {rt_id}_{att_id}")
-                else:
-                    lines.append(f"# terraform import 'aws_ec2_transit_gateway_route_table_propagation.this[\"{prop_key}\"]' {rt_id}_<attachment-id>")
-            lines.append("")
-
-        # Import Transit Gateway Routes
-        if routes:
-            lines.append("# Import Transit Gateway Routes")
-            for route in routes:
-                route_key = route['key']
-                destination = route['destination_cidr_block']
-                # Route import format: tgw-rtb-xxxxx_destination
-                lines.append(f"terraform import 'aws_ec2_transit_gateway_route.this[\"{route_key}\"]' {rt_id}_{destination}")
-            lines.append("")
-
-        lines.append("echo '✓ Import completed'")
-        lines.append("")
-
-        return '\n'.join(lines)
+        Args:
+            tgw: Transit Gateway object from AWS API
 
-    def generate_all_imports(self) -> None:
-        """Generate all import scripts for all Transit Gateways."""
-        # Load all Transit Gateways
-        tgws_data = self.load_json('transit-gateways.json')
-        tgws = tgws_data.get('TransitGateways', [])
+        Returns:
+            Paths of the generated scripts
+        """
+        generated = []
+        tgw_id = tgw['TransitGatewayId']
+        tgw_tags = self.tags_to_dict(tgw.get('Tags'))
+        tgw_name = tgw_tags.get('Name', tgw_id)
+        tgw_dirname = sanitize_dirname(tgw_name) if tgw_name != tgw_id else tgw_id
 
-        if not tgws:
-            raise ValueError("No Transit Gateway found")
+        # Create TGW directory
+        tgw_dir = self.output_dir / f'tgw-{tgw_dirname}'
+        tgw_dir.mkdir(parents=True, exist_ok=True)
 
-        print(f"Found {len(tgws)} Transit Gateway(s)")
+        # Collect all attachments for this TGW
+        self.selected_tgw_id = tgw_id
+        all_attachments = self.collect_all_attachments()
 
-        # Process each TGW
-        for tgw in tgws:
-            tgw_id = tgw['TransitGatewayId']
-            tgw_name = self.get_tag_value(tgw.get('Tags'), 'Name', tgw_id)
-            tgw_dirname = self.sanitize_dirname(tgw_name) if tgw_name != tgw_id else tgw_id
+        # Generate import.sh for this TGW
+        tgw_import = self.generate_tgw_import(tgw, all_attachments)
+        tgw_import_file = tgw_dir / 'import.sh'
+        self.write_script(tgw_import_file, tgw_import)
+        generated.append(tgw_import_file)
+
+        # Load association/propagation/route files for this TGW's route tables
+        route_tables = self.route_tables_by_tgw.get(tgw_id, [])
+        rt_data = self.load_route_table_data(
+            [rt['TransitGatewayRouteTableId'] for rt in route_tables]
+        )
+
+        # Route table scripts collected for import-all.sh (combined mode)
+        combined_sections = []
+
+        # Process each route table belonging to this TGW
+        for rt in route_tables:
+            rt_id = rt['TransitGatewayRouteTableId']
+            rt_tags = self.tags_to_dict(rt.get('Tags'))
+            rt_name = rt_tags.get('Name', rt_id)
+
+            # Create route table directory (combined mode only references it)
+            rt_dirname = sanitize_dirname(rt_name)
+            rt_dir = self.output_dir / f'{tgw_dirname}-rt-{rt_dirname}'
+            if self.mode != 'combined':
+                rt_dir.mkdir(parents=True, exist_ok=True)
 
-            # Create TGW directory
-            tgw_dir = self.output_dir / f'tgw-{tgw_dirname}'
-            tgw_dir.mkdir(parents=True, exist_ok=True)
+            # Collect attachments for this route table while resolving
+            # associations and propagations
+            rt_attachments = {}
 
-            print(f"\nProcessing TGW: {tgw_name} ({tgw_id})")
+            # Collect associations
+            associations = []
+            assoc_data = rt_data[f'tgw-rt-associations-{rt_id}.json']
+            for assoc in assoc_data.get('Associations', []):
+                if assoc.get('State') != 'associated':
+                    continue
+                att_id = assoc.get('TransitGatewayAttachmentId')
+                att = all_attachments.get(att_id)
+                if att is not None:
+                    associations.append(att['key'])
+                    rt_attachments[att['key']] = att
+
+            # Collect propagations
+            propagations = []
+            prop_data = rt_data[f'tgw-rt-propagations-{rt_id}.json']
+            for prop in prop_data.get('TransitGatewayRouteTablePropagations', []):
+                if prop.get('State') != 'enabled':
+                    continue
+                att_id = prop.get('TransitGatewayAttachmentId')
+                att = all_attachments.get(att_id)
+                if att is not None:
+                    propagations.append(att['key'])
+                    rt_attachments.setdefault(att['key'], att)
+
+            # Collect routes
+            routes = []
+            route_data = rt_data[f'tgw-rt-routes-{rt_id}.json']
+            for route in route_data.get('Routes', []):
+                if route.get('Type') != 'static':
+                    continue
+                destination = route.get('DestinationCidrBlock', '')
+                if not destination:
+                    continue
 
-            # Generate import.sh for this TGW
-            tgw_import = self.generate_tgw_import(tgw)
-            tgw_import_file = tgw_dir / 'import.sh'
-            tgw_import_file.write_text(tgw_import, encoding='utf-8')
-            tgw_import_file.chmod(0o755)
-            print(f"✓ Generated: {tgw_import_file}")
+                route_key = make_route_key(destination)
+
+                routes.append({
+                    'key': route_key,
+                    'destination_cidr_block': destination
+                })
+
+            # Generate import.sh
+            import_script = self.generate_route_table_import(
+                rt_id, rt_name, rt_attachments, associations, propagations, routes
+            )
+            if self.mode == 'combined':
+                combined_sections.append(IMPORT_ALL_RT_SECTION.format(
+                    rt_path=shlex.quote(f'../{rt_dir.name}'), script=import_script[len(SH_PREAMBLE):]
+                ))
+                continue
 
-            # Load route tables
-            tgw_rts_data = self.load_json('tgw-route-tables.json')
+            import_file = rt_dir / 'import.sh'
+            self.write_script(import_file, import_script)
+            generated.append(import_file)
 
-            # Collect all attachments for this TGW
-            all_attachments = self.collect_all_attachments()
+        if self.mode == 'combined':
+            import_all_file = tgw_dir / 'import-all.sh'
+            self.write_script(import_all_file, IMPORT_ALL_SH.format(sections=''.join(combined_sections)))
+            generated.append(import_all_file)
 
-            # Process each route table belonging to this TGW
-            for rt in tgw_rts_data.get('TransitGatewayRouteTables', []):
-                rt_id = rt['TransitGatewayRouteTableId']
-                rt_tgw_id = rt.get('TransitGatewayId')
+        return generated
 
-                # Skip route tables not belonging to this TGW
-                if rt_tgw_id != tgw_id:
-                    continue
+    def generate_all_imports(self) -> None:
+        """Generate all import scripts for all Transit Gateways."""
+        # Load all Transit Gateways
+        tgws_data = self.load_json('transit-gateways.json')
+        tgws = tgws_data.get('TransitGateways', [])
 
-                rt_name = self.get_tag_value(rt.get('Tags'), 'Name', rt_id)
+        if not tgws:
+            raise ValueError("No Transit Gateway found")
 
-                # Create route table directory
-                rt_dirname = self.sanitize_dirname(rt_name)
-                rt_dir = self.output_dir / f'{tgw_dirname}-rt-{rt_dirname}'
-                rt_dir.mkdir(parents=True, exist_ok=True)
+        print(f"Found {len(tgws)} Transit Gateway(s)")
+
+        # Generate each TGW in turn so that parsed input files are shared
+        results = [self.generate_imports_for_tgw(tgw) for tgw in tgws]
 
-                # Collect associations
-                associations = []
-                assoc_file = self.input_dir / f'tgw-rt-associations-{rt_id}.json'
-                if assoc_file.exists():
-                    with open(assoc_file, 'r', encoding='utf-8') as f:
-                        assoc_data = json.load(f)
-                        for assoc in assoc_data.get('Associations', []):
-                            if assoc.get('State') != 'associated':
-                                continue
-                            att_id = assoc.get('TransitGatewayAttachmentId')
-                            if att_id in all_attachments:
-                                att = all_attachments[att_id]
-                                associations.append(att['key'])
-
-                # Collect propagations
-                propagations = []
-                prop_file = self.input_dir / f'tgw-rt-propagations-{rt_id}.json'
-                if prop_file.exists():
-                    with open(prop_file, 'r', encoding='utf-8') as f:
-                        prop_data = json.load(f)
-                        for prop in prop_data.get('TransitGatewayRouteTablePropagations', []):
-                            if prop.get('State') != 'enabled':
-                                continue
-                            att_id = prop.get('TransitGatewayAttachmentId')
-                            if att_id in all_attachments:
-                                att = all_attachments[att_id]
-                                propagations.append(att['key'])
-
-                # Collect attachments for this route table
-                rt_attachments = {}
-
-                # Add attachments from associations
-                for assoc_key in associations:
-                    for att_id, att in all_attachments.items():
-                        if att['key'] == assoc_key:
-                            rt_attachments[assoc_key] = att
-                            break
-
-                # Add attachments from propagations
-                for prop_key in propagations:
-                    for att_id, att in all_attachments.items():
-                        if att['key'] == prop_key and prop_key not in rt_attachments:
-                            rt_attachments[prop_key] = att
-                            break
-
-                # Collect routes
-                routes = []
-                route_file = self.input_dir / f'tgw-rt-routes-{rt_id}.json'
-                if route_file.exists():
-                    with open(route_file, 'r', encoding='utf-8') as f:
-                        route_data = json.load(f)
-                        for route in route_data.get('Routes', []):
-                            if route.get('Type') != 'static':
-                                continue
-                            destination = route.get('DestinationCidrBlock', '')
-                            if not destination:
-                                continue
-
-                            dest_sanitized = destination.replace('/', '_').replace('.', '_').replace(':', '_')
-                            route_key = f'route_{dest_sanitized}'
-
-                            routes.append({
-                                'key': route_key,
-                                'destination_cidr_block': destination
-                            })
-
-                # Generate import.sh
-                import_script = self.generate_route_table_import(
-                    rt_id, rt_name, rt_attachments, associations, propagations, routes
-                )
-                import_file = rt_dir / 'import.sh'
-                import_file.write_text(import_script, encoding='utf-8')
-                import_file.chmod(0o755)
-                print(f"✓ Generated: {import_file}")
+        # Report generated files in TGW order with a single write
+        report = []
+        for tgw, generated in zip(tgws, results):
+            tgw_id = tgw['TransitGatewayId']
+            tgw_name = self.tags_to_dict(tgw.get('Tags')).get('Name', tgw_id)
+            report.append(f"\nProcessing TGW: {tgw_name} ({tgw_id})\n")
+            report.extend(f"✓ Generated: {script_file}\n" for script_file in generated)
+        sys.stdout.write(''.join(report))
 
         print(f"\n✓ All import scripts generated in: {self.output_dir}")
         print("\nNext steps:")
@@ -329,6 +513,13 @@ class ImportCommandsGeneratorV2:
         print("   terraform init")
         print("   ./import.sh")
         print("   terraform apply")
+        if self.mode == 'combined':
+            print("2. For route tables:")
+            print("   terraform init in each terraform/<tgw-name>-rt-<name>")
+            print("   Review and edit terraform/tgw-<name>/import-all.sh")
+            print("   terraform/tgw-<name>/import-all.sh")
+            print("   terraform plan in each route table directory")
+            return
         print("2. For each route table:")
         print("   cd terraform/<tgw-name>-rt-<name>")
         print("   terraform init")
@@ -364,6 +555,14 @@ def main():
         default=None,
         help='AWS Region (auto-detected from input path if not specified)'
     )
+    parser.add_argument(
+        '--mode',
+        choices=IMPORT_MODES,
+        default=DEFAULT_MODE,
+        help='per-rt: import.sh in each route table directory, '
+             'combined: one import-all.sh per TGW directory '
+             f'(default: {DEFAULT_MODE})'
+    )
 
     args = parser.parse_args()
 
@@ -385,7 +584,7 @@ def main():
             if not account_id and potential_account and potential_account.isdigit():
                 account_id = potential_account
 
-    generator = ImportCommandsGeneratorV2(args.input_dir, args.output_dir, account_id, region)
+    generator = ImportCommandsGeneratorV2(args.input_dir, args.output_dir, account_id, region, args.mode)
     generator.generate_all_imports()
 
 
@@ -11,13 +11,30 @@ Requirements: Python 3.8+
 """
 
 import json
+import os
 import re
+import sys
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Callable, Dict, Iterator, List, Any, Set, Tuple
 
 # Constants
 DEFAULT_INPUT_DIR = './output'
 DEFAULT_OUTPUT_DIR = './terraform'
+KEY_TRANSLATION = str.maketrans('- :', '___')  # Characters not allowed in map keys
+CIDR_TRANSLATION = str.maketrans('/.:', '___')  # Characters not allowed in route keys
+DIRNAME_TRANSLATION = str.maketrans(' _', '--')  # Characters replaced in directory names
+TGW_RT_PREFIX = 'tgw-rt-'  # Stripped from route table names for directory names
+ARN_REGION_PATTERN = re.compile(r'^arn:aws[^:]*:[^:]*:([^:]+):')  # arn:{partition}:{service}:{region}:...
+MAX_READ_WORKERS = 16  # Threads used to read per-route-table JSON files
+ROUTE_TABLE_FILE_KINDS = ('associations', 'propagations', 'routes')  # tgw-rt-{kind}-{rt_id}.json
+# Detail file of an attachment by its ResourceType
+ATTACHMENT_DETAIL_FILES = {
+    'vpc': 'tgw-vpc-attachment-{attachment_id}.json',
+    'peering': 'tgw-peering-attachment-{attachment_id}.json',
+    'vpn': 'tgw-vpn-attachment-{attachment_id}.json',
+    'direct-connect-gateway': 'tgw-dx-attachment-{attachment_id}.json',
+}
 
 # Static file templates
 VERSIONS_TF = """terraform {
@@ -80,6 +97,29 @@ locals {
 }
 """
 
+VERSIONS_TF_TGW = """terraform {
+  required_version = ">= 1.5"
+
+  required_providers {
+    aws = {
+      source  = "hashicorp/aws"
+      version = ">= 5.0"
+    }
+  }
+
+  # Uncomment and configure for remote state storage
+  # backend "s3" {
+  #   bucket = "my-terraform-state"
+  #   key    = "tgw/{account_id}/{region}/{tgw-name}/terraform.tfstate"
+  #   region = "ap-northeast-1"
+  # }
+}
+
+provider "aws" {
+  region = local.region
+}
+"""
+
 MAIN_TF_TGW = """# Transit Gateway
 resource "aws_ec2_transit_gateway" "this" {
   description                     = local.transit_gateway.description
@@ -170,6 +210,59 @@ data "aws_ec2_transit_gateway_attachment" "network_function" {
 }
 """
 
+OUTPUTS_TF_TGW = """# Output Transit Gateway ID and attachment IDs for use by route table directories
+output "transit_gateway_id" {
+  description = "Transit Gateway ID"
+  value       = aws_ec2_transit_gateway.this.id
+}
+
+output "transit_gateway_arn" {
+  description = "Transit Gateway ARN"
+  value       = aws_ec2_transit_gateway.this.arn
+}
+
+output "region" {
+  description = "AWS Region"
+  value       = local.region
+}
+
+output "tags" {
+  description = "Common tags"
+  value       = local.tags
+}
+
+# Output all attachment IDs for reference by route tables
+output "vpc_attachment_ids" {
+  description = "Map of VPC attachment keys to IDs"
+  value       = { for k, v in aws_ec2_transit_gateway_vpc_attachment.this : k => v.id }
+}
+
+output "peering_attachment_ids" {
+  description = "Map of peering attachment keys to IDs (Requester side)"
+  value       = { for k, v in aws_ec2_transit_gateway_peering_attachment.this : k => v.id }
+}
+
+output "peering_accepter_attachment_ids" {
+  description = "Map of peering accepter attachment keys to IDs (Accepter side - from data source)"
+  value       = { for k, v in data.aws_ec2_transit_gateway_attachment.peering_accepter : k => v.id }
+}
+
+output "vpn_attachment_ids" {
+  description = "Map of VPN attachment keys to attachment IDs (from data source)"
+  value       = { for k, v in data.aws_ec2_transit_gateway_attachment.vpn : k => v.id }
+}
+
+output "dx_gateway_attachment_ids" {
+  description = "Map of DX Gateway attachment keys to attachment IDs (from data source)"
+  value       = { for k, v in data.aws_ec2_transit_gateway_attachment.dx_gateway : k => v.id }
+}
+
+output "network_function_attachment_ids" {
+  description = "Map of Network Function attachment keys to attachment IDs (from data source)"
+  value       = { for k, v in data.aws_ec2_transit_gateway_attachment.network_function : k => v.id }
+}
+"""
+
 MAIN_TF_RT = """# Transit Gateway Route Table
 resource "aws_ec2_transit_gateway_route_table" "this" {
   transit_gateway_id = local.transit_gateway_id
@@ -236,76 +329,194 @@ resource "aws_ec2_transit_gateway_route" "this" {
 }
 """
 
+# Static files, encoded once and written as-is to every directory
+VERSIONS_TF_BYTES = VERSIONS_TF.encode('utf-8')
+VERSIONS_TF_TGW_BYTES = VERSIONS_TF_TGW.encode('utf-8')
+MAIN_TF_TGW_BYTES = MAIN_TF_TGW.encode('utf-8')
+OUTPUTS_TF_TGW_BYTES = OUTPUTS_TF_TGW.encode('utf-8')
+MAIN_TF_RT_BYTES = MAIN_TF_RT.encode('utf-8')
+
+# Fixed head and tail of a TGW's locals.tf; attachment maps go in between
+TGW_LOCALS_HEADER = """# Shared configuration for Transit Gateway
+locals {{
+  region      = "{region}"
+  account_id  = "{account_id}"
+  environment = "production"
+
+  # Transit Gateway configuration
+  transit_gateway = {{
+    name                            = "{name}"
+    description                     = "{description}"
+    amazon_side_asn                 = {amazon_side_asn}
+    auto_accept_shared_attachments  = "{auto_accept_shared_attachments}"
+    default_route_table_association = "{default_route_table_association}"
+    default_route_table_propagation = "{default_route_table_propagation}"
+    dns_support                     = "{dns_support}"
+    vpn_ecmp_support                = "{vpn_ecmp_support}"
+  }}
+"""
+
+# Attachment maps of a TGW's locals.tf in output order, with their comments
+TGW_ATTACHMENT_SECTIONS = (
+    ('vpc_attachments', 'VPC Attachments'),
+    ('peering_attachments', 'Peering Attachments (Requester side)'),
+    ('peering_accepter_attachments', 'Peering Accepter Attachments (Accepter side)'),
+    ('vpn_attachments', 'VPN Attachments (read-only)'),
+    ('dx_gateway_attachments', 'Direct Connect Gateway Attachments (read-only)'),
+    ('network_function_attachments', 'Network Function Attachments (read-only)'),
+)
+
+TGW_LOCALS_FOOTER = """  # Common tags
+  tags = {
+    ManagedBy   = "Terraform"
+    Project     = "TransitGateway"
+    Environment = local.environment
+  }
+}
+"""
+
+# Entry of the associations/propagations maps in a route table's locals.tf
+RT_ATTACHMENT_HCL = """    {key} = {{
+      attachment_key  = "{key}"
+      attachment_type = "{att_type}"
+    }}"""
+
+
+@lru_cache(maxsize=None)
+def json_parser() -> Callable[[bytes], Any]:
+    """Return the JSON parser.
+
+    orjson is used when installed, otherwise the standard library json module.
+    """
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:  # Optional: fall back to the standard library parser
+        return json.loads
+
+
+@lru_cache(maxsize=None)
+def sanitize_key(name: str) -> str:
+    """Sanitize resource name for use as Terraform map key."""
+    return name.translate(KEY_TRANSLATION).lower()
+
+
+@lru_cache(maxsize=None)
+def make_route_key(destination: str) -> str:
+    """Build Terraform map key of a route from its destination CIDR block."""
+    return f'route_{destination.translate(CIDR_TRANSLATION)}'
+
+
+@lru_cache(maxsize=None)
+def sanitize_dirname(name: str) -> str:
+    """Sanitize route table name for directory name.
+    
+    Examples:
+        tgw-rt-production -> rt-production
+        TGW-RT-Shared -> rt-shared
+    """
+    # Remove tgw-rt- prefix (case insensitive)
+    if name[:len(TGW_RT_PREFIX)].lower() == TGW_RT_PREFIX:
+        name = name[len(TGW_RT_PREFIX):]
+    return name.translate(DIRNAME_TRANSLATION).lower()
+
+
+@lru_cache(maxsize=None)
+def hcl_string(value: str) -> str:
+    """Quote a string as a JSON string; recurring tag keys and values are quoted once."""
+    return json.dumps(value)
+
+
+@lru_cache(maxsize=None)
+def hcl_string_list(values: Tuple[str, ...]) -> str:
+    """Format plain strings (such as AWS IDs) as an HCL list.
+
+    Takes a tuple so that lists shared by many attachments are formatted once.
+    """
+    return '[' + ', '.join(f'"{value}"' for value in values) + ']'
+
 
 class TerraformConfigGeneratorV2:
     """Generator for split Terraform configuration."""
 
     def __init__(self, input_dir: str, output_dir: str, account_id: str = None, region: str = None) -> None:
         self.input_dir = Path(input_dir)
+        self.input_root = os.fspath(self.input_dir)  # Joined as a str for per-file paths
         self.output_dir = Path(output_dir)
         self.account_id = account_id
         self.region = region
         self.selected_tgw_id = None  # Will be set when selecting TGW
+        self.json_cache: Dict[str, dict] = {}  # Parsed input files by filename
+
+    def parse_json(self, data: bytes) -> Any:
+        """Parse a JSON document, using orjson when it is installed."""
+        return json_parser()(data)
+
+    @cached_property
+    def input_files(self) -> Set[str]:
+        """Names of files in input directory, listed once."""
+        try:
+            with os.scandir(self.input_dir) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            return set()
 
     def load_json(self, filename: str) -> dict:
-        """Load JSON file from input directory."""
-        filepath = self.input_dir / filename
-        if not filepath.exists():
-            return {}
-        with open(filepath, encoding='utf-8') as f:
-            return json.load(f)
-
-    def get_tag_value(self, tags: List[dict] | None, key: str, default: str = "") -> str:
-        """Extract tag value from AWS tags list."""
-        if not tags:
-            return default
-        for tag in tags:
-            if tag.get('Key') == key:
-                return tag.get('Value', default)
-        return default
-
-    def sanitize_key(self, name: str) -> str:
-        """Sanitize resource name for use as Terraform map key."""
-        return name.replace('-', '_').replace(' ', '_').replace(':', '_').lower()
-
-    def sanitize_dirname(self, name: str) -> str:
-        """Sanitize route table name for directory name.
-        
-        Examples:
-            tgw-rt-production -> rt-production
-            TGW-RT-Shared -> rt-shared
+        """Load JSON file from input directory.
+
+        Each file is read once; later calls return the cached contents.
         """
-        # Remove tgw-rt- prefix (case insensitive)
-        name = re.sub(r'^tgw-rt-', '', name, flags=re.IGNORECASE)
-        return name.replace(' ', '-').replace('_', '-').lower()
-
-    def format_hcl_value(self, value: Any, indent: int = 0) -> str:
-        """Format a value as HCL."""
-        indent_str = "  " * indent
-
-        if isinstance(value, dict):
-            if not value:
-                return "{}"
-            lines = ["{"]
-            for k, v in value.items():
-                formatted = self.format_hcl_value(v, indent + 1)
-                lines.append(f'{indent_str}  {k} = {formatted}')
-            lines.append(f'{indent_str}}}')
-            return '\n'.join(lines)
-        elif isinstance(value, list):
-            if not value:
-                return "[]"
-            return json.dumps(value)
-        elif isinstance(value, bool):
-            return str(value).lower()
-        elif isinstance(value, (int, float)):
-            return str(value)
-        elif value is None:
-            return "null"
-        else:
-            # Escape quotes in strings
-            escaped = str(value).replace('"', '\\"')
-            return f'"{escaped}"'
+        if filename not in self.input_files:
+            return {}
+        if filename not in self.json_cache:
+            with open(os.path.join(self.input_root, filename), 'rb') as f:
+                self.json_cache[filename] = self.parse_json(f.read())
+        return self.json_cache[filename]
+
+    def load_jsonl(self, filename: str) -> Iterator[dict]:
+        """Iterate records of a JSON Lines file from input directory."""
+        if filename not in self.input_files:
+            return
+        with open(os.path.join(self.input_root, filename), 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield self.parse_json(line)
+
+    @cached_property
+    def attachments_data(self) -> dict:
+        """Contents of tgw-attachments.json, parsed once and shared by all TGWs."""
+        return self.load_json('tgw-attachments.json')
+
+    @cached_property
+    def attachments_by_tgw(self) -> Dict[str, List[dict]]:
+        """Attachments from tgw-attachments.json grouped by Transit Gateway ID."""
+        attachments = {}
+        for attachment in self.attachments_data.get('TransitGatewayAttachments', []):
+            attachments.setdefault(attachment.get('TransitGatewayId'), []).append(attachment)
+        return attachments
+
+    @cached_property
+    def route_tables_by_tgw(self) -> Dict[str, List[dict]]:
+        """Route tables from tgw-route-tables.json grouped by Transit Gateway ID."""
+        route_tables = {}
+        for rt in self.load_json('tgw-route-tables.json').get('TransitGatewayRouteTables', []):
+            route_tables.setdefault(rt.get('TransitGatewayId'), []).append(rt)
+        return route_tables
+
+    def selected_attachments(self) -> List[dict]:
+        """Attachments of the selected TGW, or all attachments when none is selected."""
+        if self.selected_tgw_id:
+            return self.attachments_by_tgw.get(self.selected_tgw_id, [])
+        return self.attachments_data.get('TransitGatewayAttachments', [])
+
+    def tags_to_dict(self, tags: List[dict] | None) -> Dict[str, str]:
+        """Convert AWS tags list to a {Key: Value} dict."""
+        try:
+            # AWS tags always have both Key and Value
+            return {tag['Key']: tag['Value'] for tag in tags or ()}
+        except KeyError:
+            # Skip incomplete tags so that callers' defaults (such as the resource ID) apply
+            return {tag['Key']: tag['Value'] for tag in tags or () if 'Key' in tag and 'Value' in tag}
 
     def generate_tgw_locals(self, tgw: dict) -> str:
         """Generate locals.tf content for a specific Transit Gateway.
@@ -320,226 +531,147 @@ class TerraformConfigGeneratorV2:
         self.selected_tgw_id = tgw_id  # Store selected TGW ID
         options = tgw.get('Options', {})
 
-        # Use provided region or extract from TGW owner ID
-        region = self.region if self.region else "ap-northeast-1"
+        # Use provided region or extract it from the TGW ARN
+        region = self.region
+        if not region:
+            match = ARN_REGION_PATTERN.match(tgw.get('TransitGatewayArn', ''))
+            region = match.group(1) if match else "ap-northeast-1"
         account_id = self.account_id if self.account_id else tgw.get('OwnerId', '')
 
-        tgw_name = self.get_tag_value(tgw.get('Tags'), 'Name', 'tgw')
+        tgw_name = self.tags_to_dict(tgw.get('Tags')).get('Name', 'tgw')
         tgw_desc = options.get('Description', 'Transit Gateway')
         tgw_asn = options.get('AmazonSideAsn', 64512)
 
-        lines = ["# Shared configuration for Transit Gateway", "locals {"]
-        lines.append(f'  region      = "{region}"')
-        lines.append(f'  account_id  = "{account_id}"')
-        lines.append('  environment = "production"')
-        lines.append("")
-        lines.append("  # Transit Gateway configuration")
-        lines.append("  transit_gateway = {")
-        lines.append(f'    name                            = "{tgw_name}"')
-        lines.append(f'    description                     = "{tgw_desc}"')
-        lines.append(f'    amazon_side_asn                 = {tgw_asn}')
-        lines.append(f'    auto_accept_shared_attachments  = "{options.get("AutoAcceptSharedAttachments", "disable")}"')
-        lines.append(f'    default_route_table_association = "{options.get("DefaultRouteTableAssociation", "disable")}"')
-        lines.append(f'    default_route_table_propagation = "{options.get("DefaultRouteTablePropagation", "disable")}"')
-        lines.append(f'    dns_support                     = "{options.get("DnsSupport", "enable")}"')
-        lines.append(f'    vpn_ecmp_support                = "{options.get("VpnEcmpSupport", "enable")}"')
-        lines.append("  }")
-        lines.append("")
-
-        # Collect VPC attachments for the selected TGW
-        tgw_attachments_data = self.load_json('tgw-attachments.json')
-        vpc_attachments = {}
-        peering_attachments = {}
-        peering_accepter_attachments = {}
-        vpn_attachments = {}
-        dx_gateway_attachments = {}
-        network_function_attachments = {}
-
-        for attachment in tgw_attachments_data.get('TransitGatewayAttachments', []):
-            # Only include attachments for the selected TGW
-            if attachment.get('TransitGatewayId') != self.selected_tgw_id:
+        lines = [TGW_LOCALS_HEADER.format(
+            region=region,
+            account_id=account_id,
+            name=tgw_name,
+            description=tgw_desc,
+            amazon_side_asn=tgw_asn,
+            auto_accept_shared_attachments=options.get("AutoAcceptSharedAttachments", "disable"),
+            default_route_table_association=options.get("DefaultRouteTableAssociation", "disable"),
+            default_route_table_propagation=options.get("DefaultRouteTablePropagation", "disable"),
+            dns_support=options.get("DnsSupport", "enable"),
+            vpn_ecmp_support=options.get("VpnEcmpSupport", "enable"),
+        )]
+
+        # Format attachment blocks of the selected TGW by map, keyed by attachment key
+        maps = {map_name: {} for map_name, _ in TGW_ATTACHMENT_SECTIONS}
+        formatters = {
+            'vpc': self.format_vpc_attachment,
+            'peering': self.format_peering_attachment,
+            'vpn': self.format_vpn_attachment,
+            'direct-connect-gateway': self.format_dx_gateway_attachment,
+            'connect': self.format_network_function_attachment,
+        }
+
+        for attachment in self.attachments_by_tgw.get(self.selected_tgw_id, []):
+            formatter = formatters.get(attachment.get('ResourceType', ''))
+            if formatter is None:
                 continue
-
             attachment_id = attachment['TransitGatewayAttachmentId']
-            resource_type = attachment.get('ResourceType', '')
-            name = self.get_tag_value(attachment.get('Tags'), 'Name', attachment_id)
-            key = self.sanitize_key(name)
-
-            if resource_type == 'vpc':
-                vpc_id = attachment.get('ResourceId', '')
-                subnet_ids = []
-                vpc_att_file = self.input_dir / f'tgw-vpc-attachment-{attachment_id}.json'
-                if vpc_att_file.exists():
-                    with open(vpc_att_file, 'r', encoding='utf-8') as f:
-                        vpc_att_detail = json.load(f)
-                        vpc_att = vpc_att_detail.get('TransitGatewayVpcAttachments', [])
-                        if vpc_att:
-                            subnet_ids = vpc_att[0].get('SubnetIds', [])
-
-                vpc_attachments[key] = {
-                    'name': name,
-                    'vpc_id': vpc_id,
-                    'subnet_ids': subnet_ids,
-                    'attachment_id': attachment_id
-                }
-
-            elif resource_type == 'peering':
-                peer_att_file = self.input_dir / f'tgw-peering-attachment-{attachment_id}.json'
-                peer_tgw_id = ''
-                peer_region = ''
-                peer_account_id = ''
-                is_requester = False
-
-                if peer_att_file.exists():
-                    with open(peer_att_file, 'r', encoding='utf-8') as f:
-                        peer_att_detail = json.load(f)
-                        peer_att = peer_att_detail.get('TransitGatewayPeeringAttachments', [])
-                        if peer_att:
-                            peering = peer_att[0]
-                            requester_tgw_id = peering.get('RequesterTgwInfo', {}).get('TransitGatewayId', '')
-                            accepter_tgw_id = peering.get('AccepterTgwInfo', {}).get('TransitGatewayId', '')
-
-                            # Check if this TGW is the requester or accepter
-                            if requester_tgw_id == self.selected_tgw_id:
-                                is_requester = True
-                                peer_tgw_id = accepter_tgw_id
-                                peer_region = peering.get('AccepterTgwInfo', {}).get('Region', '')
-                                peer_account_id = peering.get('AccepterTgwInfo', {}).get('OwnerId', '')
-                            elif accepter_tgw_id == self.selected_tgw_id:
-                                # This is the accepter side
-                                peer_tgw_id = requester_tgw_id
-                                peer_region = peering.get('RequesterTgwInfo', {}).get('Region', '')
-                                peer_account_id = peering.get('RequesterTgwInfo', {}).get('OwnerId', '')
-
-                # Add to appropriate collection
-                if is_requester and peer_tgw_id:
-                    # Requester side: manage as resource
-                    peering_attachments[key] = {
-                        'name': name,
-                        'peer_transit_gateway_id': peer_tgw_id,
-                        'peer_region': peer_region,
-                        'peer_account_id': peer_account_id,
-                        'attachment_id': attachment_id
-                    }
-                elif not is_requester and peer_tgw_id:
-                    # Accepter side: reference as data source
-                    peering_accepter_attachments[key] = {
-                        'name': name,
-                        'attachment_id': attachment_id,
-                        'peer_transit_gateway_id': peer_tgw_id,
-                        'peer_region': peer_region,
-                        'peer_account_id': peer_account_id
-                    }
-
-            elif resource_type == 'vpn':
-                vpn_attachments[key] = {
-                    'name': name,
-                    'attachment_id': attachment_id,
-                    'vpn_connection_id': attachment.get('ResourceId', '')
-                }
-
-            elif resource_type == 'direct-connect-gateway':
-                dx_gateway_attachments[key] = {
-                    'name': name,
-                    'attachment_id': attachment_id,
-                    'dx_gateway_id': attachment.get('ResourceId', '')
-                }
-
-            elif resource_type == 'connect':
-                network_function_attachments[key] = {
-                    'name': name,
-                    'attachment_id': attachment_id,
-                    'resource_id': attachment.get('ResourceId', '')
-                }
-
-        # Add VPC Attachments
-        lines.append("  # VPC Attachments")
-        lines.append("  vpc_attachments = {")
-        for key, att in vpc_attachments.items():
-            lines.append(f'    {key} = {{')
-            lines.append(f'      name       = "{att["name"]}"')
-            lines.append(f'      vpc_id     = "{att["vpc_id"]}"')
-            lines.append(f'      subnet_ids = {json.dumps(att["subnet_ids"])}')
-            lines.append('    }')
-        lines.append("  }")
-        lines.append("")
-
-        # Add Peering Attachments (Requester side)
-        lines.append("  # Peering Attachments (Requester side)")
-        lines.append("  peering_attachments = {")
-        for key, att in peering_attachments.items():
-            lines.append(f'    {key} = {{')
-            lines.append(f'      name                    = "{att["name"]}"')
-            lines.append(f'      peer_transit_gateway_id = "{att["peer_transit_gateway_id"]}"')
-            lines.append(f'      peer_region             = "{att["peer_region"]}"')
-            if att.get('peer_account_id'):
-                lines.append(f'      peer_account_id         = "{att["peer_account_id"]}"')
-            lines.append('    }')
-        lines.append("  }")
-        lines.append("")
-
-        # Add Peering Accepter Attachments (Accepter side)
-        lines.append("  # Peering Accepter Attachments (Accepter side)")
-        lines.append("  peering_accepter_attachments = {")
-        for key, att in peering_accepter_attachments.items():
-            lines.append(f'    {key} = {{')
-            lines.append(f'      name          = "{att["name"]}"')
-            lines.append(f'      attachment_id = "{att["attachment_id"]}"')
-            lines.append('    }')
-        lines.append("  }")
-        lines.append("")
-
-        # Add VPN Attachments
-        lines.append("  # VPN Attachments (read-only)")
-        lines.append("  vpn_attachments = {")
-        for key, att in vpn_attachments.items():
-            lines.append(f'    {key} = {{')
-            lines.append(f'      name              = "{att["name"]}"')
-            lines.append(f'      attachment_id     = "{att["attachment_id"]}"')
-            lines.append(f'      vpn_connection_id = "{att["vpn_connection_id"]}"')
-            lines.append('    }')
-        lines.append("  }")
-        lines.append("")
-
-        # Add Direct Connect Gateway Attachments
-        lines.append("  # Direct Connect Gateway Attachments (read-only)")
-        lines.append("  dx_gateway_attachments = {")
-        for key, att in dx_gateway_attachments.items():
-            lines.append(f'    {key} = {{')
-            lines.append(f'      name          = "{att["name"]}"')
-            lines.append(f'      attachment_id = "{att["attachment_id"]}"')
-            lines.append(f'      dx_gateway_id = "{att["dx_gateway_id"]}"')
-            lines.append('    }')
-        lines.append("  }")
-        lines.append("")
-
-        # Add Network Function Attachments
-        lines.append("  # Network Function Attachments (read-only)")
-        lines.append("  network_function_attachments = {")
-        for key, att in network_function_attachments.items():
-            lines.append(f'    {key} = {{')
-            lines.append(f'      name          = "{att["name"]}"')
-            lines.append(f'      attachment_id = "{att["attachment_id"]}"')
-            lines.append('    }')
-        lines.append("  }")
-        lines.append("")
-
-        lines.append("  # Common tags")
-        lines.append("  tags = {")
-        lines.append('    ManagedBy   = "Terraform"')
-        lines.append('    Project     = "TransitGateway"')
-        lines.append('    Environment = local.environment')
-        lines.append("  }")
-        lines.append("}")
-        lines.append("")
+            name = self.tags_to_dict(attachment.get('Tags')).get('Name', attachment_id)
+            key = sanitize_key(name)
+            formatted = formatter(attachment, name, key)
+            if formatted:
+                map_name, block = formatted
+                maps[map_name][key] = block
+
+        # Add attachment maps in section order
+        for map_name, comment in TGW_ATTACHMENT_SECTIONS:
+            lines.append(f"  # {comment}")
+            lines.append(f"  {map_name} = {{")
+            lines.extend(maps[map_name].values())
+            lines.append("  }")
+            lines.append("")
+
+        lines.append(TGW_LOCALS_FOOTER)
 
         return '\n'.join(lines)
 
+    def format_vpc_attachment(self, attachment: dict, name: str, key: str) -> Tuple[str, str]:
+        """Format the vpc_attachments block of a VPC attachment."""
+        subnet_ids = []
+        vpc_att_detail = self.load_json(f'tgw-vpc-attachment-{attachment["TransitGatewayAttachmentId"]}.json')
+        vpc_att = vpc_att_detail.get('TransitGatewayVpcAttachments', [])
+        if vpc_att:
+            subnet_ids = vpc_att[0].get('SubnetIds', [])
+
+        return 'vpc_attachments', (f'    {key} = {{\n'
+                                   f'      name       = "{name}"\n'
+                                   f'      vpc_id     = "{attachment.get("ResourceId", "")}"\n'
+                                   f'      subnet_ids = {hcl_string_list(tuple(subnet_ids))}\n'
+                                   '    }')
+
+    def format_peering_attachment(self, attachment: dict, name: str, key: str) -> Tuple[str, str] | None:
+        """Format the block of a peering attachment of the selected TGW.
+
+        Requester side attachments are managed as resources and accepter side
+        attachments are referenced as data sources.
+        """
+        attachment_id = attachment['TransitGatewayAttachmentId']
+        peer_att_detail = self.load_json(f'tgw-peering-attachment-{attachment_id}.json')
+        peer_att = peer_att_detail.get('TransitGatewayPeeringAttachments', [])
+        if not peer_att:
+            return None
+
+        peering = peer_att[0]
+        requester = peering.get('RequesterTgwInfo') or {}
+        accepter = peering.get('AccepterTgwInfo') or {}
+        requester_tgw_id = requester.get('TransitGatewayId', '')
+        accepter_tgw_id = accepter.get('TransitGatewayId', '')
+
+        # Check if this TGW is the requester or accepter
+        if requester_tgw_id == self.selected_tgw_id:
+            peer_tgw_id = accepter_tgw_id
+            peer_region = accepter.get('Region', '')
+            peer_account_id = accepter.get('OwnerId', '')
+            if not peer_tgw_id:
+                return None
+            # Requester side: manage as resource
+            block = (f'    {key} = {{\n'
+                     f'      name                    = "{name}"\n'
+                     f'      peer_transit_gateway_id = "{peer_tgw_id}"\n'
+                     f'      peer_region             = "{peer_region}"\n')
+            if peer_account_id:
+                block += f'      peer_account_id         = "{peer_account_id}"\n'
+            return 'peering_attachments', block + '    }'
+
+        if accepter_tgw_id == self.selected_tgw_id and requester_tgw_id:
+            # Accepter side: reference as data source
+            return 'peering_accepter_attachments', (f'    {key} = {{\n'
+                                                    f'      name          = "{name}"\n'
+                                                    f'      attachment_id = "{attachment_id}"\n'
+                                                    '    }')
+        return None
+
+    def format_vpn_attachment(self, attachment: dict, name: str, key: str) -> Tuple[str, str]:
+        """Format the vpn_attachments block of a VPN attachment."""
+        return 'vpn_attachments', (f'    {key} = {{\n'
+                                   f'      name              = "{name}"\n'
+                                   f'      attachment_id     = "{attachment["TransitGatewayAttachmentId"]}"\n'
+                                   f'      vpn_connection_id = "{attachment.get("ResourceId", "")}"\n'
+                                   '    }')
+
+    def format_dx_gateway_attachment(self, attachment: dict, name: str, key: str) -> Tuple[str, str]:
+        """Format the dx_gateway_attachments block of a Direct Connect Gateway attachment."""
+        return 'dx_gateway_attachments', (f'    {key} = {{\n'
+                                          f'      name          = "{name}"\n'
+                                          f'      attachment_id = "{attachment["TransitGatewayAttachmentId"]}"\n'
+                                          f'      dx_gateway_id = "{attachment.get("ResourceId", "")}"\n'
+                                          '    }')
+
+    def format_network_function_attachment(self, attachment: dict, name: str, key: str) -> Tuple[str, str]:
+        """Format the network_function_attachments block of a Connect attachment."""
+        return 'network_function_attachments', (f'    {key} = {{\n'
+                                                f'      name          = "{name}"\n'
+                                                f'      attachment_id = "{attachment["TransitGatewayAttachmentId"]}"\n'
+                                                '    }')
+
     def generate_route_table_locals(self, rt_id: str, rt_name: str,
                                      rt_tags: dict,
-                                     attachments_data: Dict[str, Any],
-                                     associations: List[Tuple[str, str, str]],
-                                     propagations: List[Tuple[str, str, str]],
+                                     associations: List[Tuple[str, str]],
+                                     propagations: List[Tuple[str, str]],
                                      routes: List[Dict[str, Any]]) -> str:
         """Generate locals.tf content for a route table."""
         lines = ["# Route Table Configuration"]
@@ -555,22 +687,16 @@ class TerraformConfigGeneratorV2:
         # Associations
         lines.append("  # Route Table Associations")
         lines.append("  associations = {")
-        for assoc_key, att_key, att_type in associations:
-            lines.append(f'    {assoc_key} = {{')
-            lines.append(f'      attachment_key  = "{att_key}"')
-            lines.append(f'      attachment_type = "{att_type}"')
-            lines.append('    }')
+        for att_key, att_type in associations:
+            lines.append(RT_ATTACHMENT_HCL.format(key=att_key, att_type=att_type))
         lines.append("  }")
         lines.append("")
 
         # Propagations
         lines.append("  # Route Table Propagations")
         lines.append("  propagations = {")
-        for prop_key, att_key, att_type in propagations:
-            lines.append(f'    {prop_key} = {{')
-            lines.append(f'      attachment_key  = "{att_key}"')
-            lines.append(f'      attachment_type = "{att_type}"')
-            lines.append('    }')
+        for att_key, att_type in propagations:
+            lines.append(RT_ATTACHMENT_HCL.format(key=att_key, att_type=att_type))
         lines.append("  }")
         lines.append("")
 
@@ -578,22 +704,22 @@ class TerraformConfigGeneratorV2:
         lines.append("  # Transit Gateway Routes")
         lines.append("  tgw_routes = {")
         for route in routes:
-            route_key = route['key']
-            lines.append(f'    {route_key} = {{')
-            lines.append(f'      destination_cidr_block = "{route["destination_cidr_block"]}"')
+            block = (f'    {route["key"]} = {{\n'
+                     f'      destination_cidr_block = "{route["destination_cidr_block"]}"\n')
             if route.get('attachment_key'):
-                lines.append(f'      attachment_key         = "{route["attachment_key"]}"')
-                lines.append(f'      attachment_type        = "{route["attachment_type"]}"')
+                block += (f'      attachment_key         = "{route["attachment_key"]}"\n'
+                          f'      attachment_type        = "{route["attachment_type"]}"\n')
             if route.get('blackhole'):
-                lines.append('      blackhole              = true')
-            lines.append('    }')
+                block += '      blackhole              = true\n'
+            lines.append(block + '    }')
         lines.append("  }")
         lines.append("")
 
         # Tags
         lines.append("  # Tags specific to this route table")
         if rt_tags:
-            lines.append(f'  route_table_tags = {json.dumps(rt_tags)}')
+            tags_hcl = ', '.join(f'{hcl_string(k)}: {hcl_string(v)}' for k, v in rt_tags.items())
+            lines.append(f'  route_table_tags = {{{tags_hcl}}}')
         else:
             lines.append('  route_table_tags = {}')
         lines.append("}")
@@ -602,17 +728,18 @@ class TerraformConfigGeneratorV2:
         return '\n'.join(lines)
 
     def collect_all_attachments(self) -> Dict[str, Any]:
-        """Collect all attachment information indexed by attachment_id."""
-        attachments = {}
+        """Collect all attachment information indexed by attachment_id.
 
-        # Load all data
-        tgw_attachments_data = self.load_json('tgw-attachments.json')
+        Only collects attachments belonging to the selected TGW.
+        """
+        attachments = {}
 
-        for attachment in tgw_attachments_data.get('TransitGatewayAttachments', []):
+        for attachment in self.selected_attachments():
             attachment_id = attachment['TransitGatewayAttachmentId']
             resource_type = attachment.get('ResourceType', '')
-            name = self.get_tag_value(attachment.get('Tags'), 'Name', attachment_id)
-            key = self.sanitize_key(name)
+            tags = self.tags_to_dict(attachment.get('Tags'))
+            name = tags.get('Name', attachment_id)
+            key = sanitize_key(name)
 
             # Normalize resource types for Terraform compatibility
             normalized_type = resource_type
@@ -623,80 +750,69 @@ class TerraformConfigGeneratorV2:
 
             attachments[attachment_id] = {
                 'key': key,
-                'type': normalized_type,
+                'type': sys.intern(normalized_type),  # Few distinct values shared by many tuples
                 'name': name,
-                'tags': {tag['Key']: tag['Value'] for tag in attachment.get('Tags', []) if 'Key' in tag},
+                'tags': tags,
                 'attachment_id': attachment_id
             }
 
             if resource_type == 'vpc':
                 vpc_id = attachment.get('ResourceId', '')
                 subnet_ids = []
-                vpc_att_file = self.input_dir / f'tgw-vpc-attachment-{attachment_id}.json'
-                if vpc_att_file.exists():
-                    with open(vpc_att_file, 'r', encoding='utf-8') as f:
-                        vpc_att_detail = json.load(f)
-                        vpc_att = vpc_att_detail.get('TransitGatewayVpcAttachments', [])
-                        if vpc_att:
-                            subnet_ids = vpc_att[0].get('SubnetIds', [])
+                vpc_att_detail = self.load_json(f'tgw-vpc-attachment-{attachment_id}.json')
+                vpc_att = vpc_att_detail.get('TransitGatewayVpcAttachments', [])
+                if vpc_att:
+                    subnet_ids = vpc_att[0].get('SubnetIds', [])
 
+                options = attachment.get('Options') or {}
                 attachments[attachment_id].update({
                     'vpc_id': vpc_id,
                     'subnet_ids': subnet_ids,
-                    'appliance_mode_support': attachment.get('Options', {}).get('ApplianceModeSupport', 'disable'),
-                    'dns_support': attachment.get('Options', {}).get('DnsSupport', 'enable'),
-                    'ipv6_support': attachment.get('Options', {}).get('Ipv6Support', 'disable'),
+                    'appliance_mode_support': options.get('ApplianceModeSupport', 'disable'),
+                    'dns_support': options.get('DnsSupport', 'enable'),
+                    'ipv6_support': options.get('Ipv6Support', 'disable'),
                 })
 
             elif resource_type == 'peering':
-                peer_att_file = self.input_dir / f'tgw-peering-attachment-{attachment_id}.json'
-                if peer_att_file.exists():
-                    with open(peer_att_file, 'r', encoding='utf-8') as f:
-                        peer_att_detail = json.load(f)
-                        peer_att = peer_att_detail.get('TransitGatewayPeeringAttachments', [])
-                        if peer_att:
-                            peering = peer_att[0]
-                            requester_tgw_id = peering.get('RequesterTgwInfo', {}).get('TransitGatewayId', '')
-
-                            # Determine if this is requester or accepter side
-                            # This will be used in route table associations
-                            peering_role = 'peering' if requester_tgw_id == attachment.get('TransitGatewayId') else 'peering_accepter'
-
-                            # Update normalized_type based on role
-                            if normalized_type == 'peering':
-                                normalized_type = peering_role
-
-                            # Update attachments dict with new type
-                            attachments[attachment_id]['type'] = normalized_type
-
-                            attachments[attachment_id].update({
-                                'peer_transit_gateway_id': peering.get('AccepterTgwInfo', {}).get('TransitGatewayId', ''),
-                                'peer_region': peering.get('AccepterTgwInfo', {}).get('Region', ''),
-                                'peer_account_id': peering.get('AccepterTgwInfo', {}).get('OwnerId', ''),
-                            })
+                peer_att_detail = self.load_json(f'tgw-peering-attachment-{attachment_id}.json')
+                peer_att = peer_att_detail.get('TransitGatewayPeeringAttachments', [])
+                if peer_att:
+                    peering = peer_att[0]
+                    requester_tgw_id = (peering.get('RequesterTgwInfo') or {}).get('TransitGatewayId', '')
+                    accepter = peering.get('AccepterTgwInfo') or {}
+
+                    # Determine if this is requester or accepter side
+                    # This will be used in route table associations
+                    peering_role = 'peering' if requester_tgw_id == attachment.get('TransitGatewayId') else 'peering_accepter'
+
+                    # Update normalized_type based on role
+                    if normalized_type == 'peering':
+                        normalized_type = peering_role
+
+                    # Update attachments dict with new type
+                    attachments[attachment_id]['type'] = normalized_type
+
+                    attachments[attachment_id].update({
+                        'peer_transit_gateway_id': accepter.get('TransitGatewayId', ''),
+                        'peer_region': accepter.get('Region', ''),
+                        'peer_account_id': accepter.get('OwnerId', ''),
+                    })
 
             elif resource_type == 'vpn':
                 vpn_conn_id = attachment.get('ResourceId', '')
-                vpn_att_file = self.input_dir / f'tgw-vpn-attachment-{attachment_id}.json'
-                if vpn_att_file.exists():
-                    with open(vpn_att_file, 'r', encoding='utf-8') as f:
-                        vpn_detail = json.load(f)
-                        vpn_conns = vpn_detail.get('VpnConnections', [])
-                        if vpn_conns:
-                            vpn = vpn_conns[0]
-                            attachments[attachment_id].update({
-                                'customer_gateway_id': vpn.get('CustomerGatewayId', ''),
-                                'type': vpn.get('Type', 'ipsec.1'),
-                                'static_routes_only': vpn.get('Options', {}).get('StaticRoutesOnly', False),
-                            })
+                vpn_detail = self.load_json(f'tgw-vpn-attachment-{attachment_id}.json')
+                vpn_conns = vpn_detail.get('VpnConnections', [])
+                if vpn_conns:
+                    vpn = vpn_conns[0]
+                    attachments[attachment_id].update({
+                        'customer_gateway_id': vpn.get('CustomerGatewayId', ''),
+                        'vpn_type': vpn.get('Type', 'ipsec.1'),  # Connection type; 'type' stays the attachment kind
+                        'static_routes_only': (vpn.get('Options') or {}).get('StaticRoutesOnly', False),
+                    })
 
             elif resource_type == 'direct-connect-gateway':
                 dx_gw_id = attachment.get('ResourceId', '')
-                dx_att_file = self.input_dir / f'tgw-dx-attachment-{attachment_id}.json'
-                dx_gw_data = None
-                if dx_att_file.exists():
-                    with open(dx_att_file, 'r', encoding='utf-8') as f:
-                        dx_gw_data = json.load(f)
+                dx_gw_data = self.load_json(f'tgw-dx-attachment-{attachment_id}.json')
 
                 allowed_prefixes = []
                 # Note: allowed_prefixes might need to be extracted differently
@@ -709,250 +825,244 @@ class TerraformConfigGeneratorV2:
 
         return attachments
 
-    def generate_all_configs(self) -> None:
-        """Generate all configuration files for all Transit Gateways."""
-        # Load all Transit Gateways
-        tgws_data = self.load_json('transit-gateways.json')
-        tgws = tgws_data.get('TransitGateways', [])
-
-        if not tgws:
-            raise ValueError("No Transit Gateway found")
-
-        print(f"Found {len(tgws)} Transit Gateway(s)")
+    def prefetch_attachment_details(self) -> None:
+        """Read the detail files of the selected TGW's attachments concurrently into the JSON cache.
 
-        # Process each TGW
-        for tgw in tgws:
-            tgw_id = tgw['TransitGatewayId']
-            tgw_name = self.get_tag_value(tgw.get('Tags'), 'Name', tgw_id)
-            tgw_dirname = self.sanitize_dirname(tgw_name) if tgw_name != tgw_id else tgw_id
-
-            # Create TGW directory
-            tgw_dir = self.output_dir / f'tgw-{tgw_dirname}'
-            tgw_dir.mkdir(parents=True, exist_ok=True)
-
-            print(f"\nProcessing TGW: {tgw_name} ({tgw_id})")
-
-            # Generate locals.tf for this TGW
-            tgw_locals = self.generate_tgw_locals(tgw)
-            (tgw_dir / 'locals.tf').write_text(tgw_locals, encoding='utf-8')
-            print(f"✓ Generated: {tgw_dir / 'locals.tf'}")
-
-            # Write static files for this TGW directory
-            tgw_versions = """terraform {
-  required_version = ">= 1.5"
-
-  required_providers {
-    aws = {
-      source  = "hashicorp/aws"
-      version = ">= 5.0"
-    }
-  }
-
-  # Uncomment and configure for remote state storage
-  # backend "s3" {
-  #   bucket = "my-terraform-state"
-  #   key    = "tgw/{account_id}/{region}/{tgw-name}/terraform.tfstate"
-  #   region = "ap-northeast-1"
-  # }
-}
-
-provider "aws" {
-  region = local.region
-}
-"""
-
-            tgw_main = MAIN_TF_TGW
-
-            tgw_outputs = """# Output Transit Gateway ID and attachment IDs for use by route table directories
-output "transit_gateway_id" {
-  description = "Transit Gateway ID"
-  value       = aws_ec2_transit_gateway.this.id
-}
-
-output "transit_gateway_arn" {
-  description = "Transit Gateway ARN"
-  value       = aws_ec2_transit_gateway.this.arn
-}
+        generate_tgw_locals() and collect_all_attachments() then load them
+        from the cache instead of reading them one by one.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        filenames = [ATTACHMENT_DETAIL_FILES[attachment.get('ResourceType')].format(
+                         attachment_id=attachment['TransitGatewayAttachmentId'])
+                     for attachment in self.selected_attachments()
+                     if attachment.get('ResourceType') in ATTACHMENT_DETAIL_FILES]
+        pending = [name for name in filenames if name not in self.json_cache]
+        with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as executor:
+            list(executor.map(self.load_json, pending))
+
+    @cached_property
+    def route_table_manifest(self) -> Dict[str, Dict[str, dict]]:
+        """Records from tgw-rt-{kind}.jsonl manifests written by fetch_aws_resources.sh.
+
+        Each record is the per-route-table API response plus its
+        TransitGatewayRouteTableId. Every manifest is parsed once per run and
+        its records are grouped by route table ID, each indexed by the
+        equivalent per-route-table filename so it can stand in for that file.
+        Records without a route table ID are skipped.
+        """
+        records = {}
+        for kind in ROUTE_TABLE_FILE_KINDS:
+            for record in self.load_jsonl(f'tgw-rt-{kind}.jsonl'):
+                rt_id = record.get('TransitGatewayRouteTableId')
+                if rt_id is not None:
+                    records.setdefault(rt_id, {})[f'tgw-rt-{kind}-{rt_id}.json'] = record
+        return records
+
+    def load_route_table_manifest(self, rt_ids: List[str]) -> Dict[str, dict]:
+        """Take the manifest records of route tables, indexed by per-route-table filename.
+
+        Records are removed from route_table_manifest as they are taken, so
+        those of TGWs already generated are released. A manifest record takes
+        precedence over the per-route-table file of the same route table.
+        """
+        records = {}
+        for rt_id in rt_ids:
+            records.update(self.route_table_manifest.pop(rt_id, {}))
+        return records
 
-output "region" {
-  description = "AWS Region"
-  value       = local.region
-}
+    def load_route_table_data(self, rt_ids: List[str]) -> Dict[str, dict]:
+        """Load association, propagation and route files for route tables.
 
-output "tags" {
-  description = "Common tags"
-  value       = local.tags
-}
+        Records from the JSON Lines manifests are used when available. Other
+        files are read concurrently since each route table has its own set of
+        small files.
 
-# Output all attachment IDs for reference by route tables
-output "vpc_attachment_ids" {
-  description = "Map of VPC attachment keys to IDs"
-  value       = { for k, v in aws_ec2_transit_gateway_vpc_attachment.this : k => v.id }
-}
-
-output "peering_attachment_ids" {
-  description = "Map of peering attachment keys to IDs (Requester side)"
-  value       = { for k, v in aws_ec2_transit_gateway_peering_attachment.this : k => v.id }
-}
+        Returns:
+            Parsed JSON indexed by filename
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        filenames = [f'tgw-rt-{kind}-{rt_id}.json'
+                     for rt_id in rt_ids
+                     for kind in ROUTE_TABLE_FILE_KINDS]
+        data = self.load_route_table_manifest(rt_ids)
+        pending = [name for name in filenames if name not in data]
+        with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as executor:
+            data.update(zip(pending, executor.map(self.load_json, pending)))
+        return {name: data[name] for name in filenames}
+
+    def write_file(self, filepath: str | Path, content: str | bytes) -> None:
+        """Write a generated Terraform file, given as text or UTF-8 bytes.
+
+        A file that already has this content is left untouched, so re-running
+        the generator does not rewrite unchanged files.
+        """
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        fd = os.open(filepath, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            if os.fstat(fd).st_size == len(data) and os.read(fd, len(data) + 1) == data:
+                return
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+    def generate_configs_for_tgw(self, tgw: dict) -> List[Path]:
+        """Generate the TGW directory and the directories of its route tables.
 
-output "peering_accepter_attachment_ids" {
-  description = "Map of peering accepter attachment keys to IDs (Accepter side - from data source)"
-  value       = { for k, v in data.aws_ec2_transit_gateway_attachment.peering_accepter : k => v.id }
-}
+        Args:
+            tgw: Transit Gateway object from AWS API
 
-output "vpn_attachment_ids" {
-  description = "Map of VPN attachment keys to attachment IDs (from data source)"
-  value       = { for k, v in data.aws_ec2_transit_gateway_attachment.vpn : k => v.id }
-}
+        Returns:
+            Paths of the generated files to report (all TGW files, locals.tf of route tables)
+        """
+        generated = []
+        tgw_id = tgw['TransitGatewayId']
+        tgw_name = self.tags_to_dict(tgw.get('Tags')).get('Name', tgw_id)
+        tgw_dirname = sanitize_dirname(tgw_name) if tgw_name != tgw_id else tgw_id
+
+        # Create TGW directory
+        tgw_dir = self.output_dir / f'tgw-{tgw_dirname}'
+        tgw_dir.mkdir(parents=True, exist_ok=True)
+
+        # Read attachment detail files, then generate locals.tf for this TGW
+        self.selected_tgw_id = tgw_id
+        self.prefetch_attachment_details()
+        tgw_locals = self.generate_tgw_locals(tgw)
+
+        # Write all files for this TGW directory
+        tgw_files = [
+            ('locals.tf', tgw_locals),
+            ('versions.tf', VERSIONS_TF_TGW_BYTES),
+            ('main.tf', MAIN_TF_TGW_BYTES),
+            ('outputs.tf', OUTPUTS_TF_TGW_BYTES),
+        ]
+        for filename, content in tgw_files:
+            self.write_file(tgw_dir / filename, content)
+            generated.append(tgw_dir / filename)
+
+        # Collect all attachments for this TGW
+        all_attachments = self.collect_all_attachments()
+
+        # Load association/propagation/route files for this TGW's route tables
+        route_tables = self.route_tables_by_tgw.get(tgw_id, [])
+        rt_data = self.load_route_table_data(
+            [rt['TransitGatewayRouteTableId'] for rt in route_tables]
+        )
+
+        # Update DATA_TF to reference the correct TGW directory
+        data_tf_content = DATA_TF.replace('../tgw/', f'../tgw-{tgw_dirname}/').encode('utf-8')
+
+        # Process each route table belonging to this TGW
+        for rt in route_tables:
+            rt_id = rt['TransitGatewayRouteTableId']
+            rt_tags = self.tags_to_dict(rt.get('Tags'))
+            rt_name = rt_tags.get('Name', rt_id)
+
+            # Create route table directory
+            rt_dirname = sanitize_dirname(rt_name)
+            rt_dir = self.output_dir / f'{tgw_dirname}-rt-{rt_dirname}'
+            rt_dir.mkdir(parents=True, exist_ok=True)
+
+            # Collect associations
+            assoc_data = rt_data[f'tgw-rt-associations-{rt_id}.json']
+            associations = [
+                (att['key'], att['type'])
+                for att in (all_attachments.get(assoc.get('TransitGatewayAttachmentId'))
+                            for assoc in assoc_data.get('Associations', [])
+                            if assoc.get('State') == 'associated')
+                if att is not None
+            ]
+
+            # Collect propagations
+            prop_data = rt_data[f'tgw-rt-propagations-{rt_id}.json']
+            propagations = [
+                (att['key'], att['type'])
+                for att in (all_attachments.get(prop.get('TransitGatewayAttachmentId'))
+                            for prop in prop_data.get('TransitGatewayRouteTablePropagations', [])
+                            if prop.get('State') == 'enabled')
+                if att is not None
+            ]
+
+            # Collect routes
+            routes = []
+            routes_data = rt_data[f'tgw-rt-routes-{rt_id}.json']
+            for route in routes_data.get('Routes', []):
+                if route.get('Type') == 'propagated':
+                    continue
+                dest_cidr = route.get('DestinationCidrBlock', '')
+                if not dest_cidr:
+                    continue
 
-output "dx_gateway_attachment_ids" {
-  description = "Map of DX Gateway attachment keys to attachment IDs (from data source)"
-  value       = { for k, v in data.aws_ec2_transit_gateway_attachment.dx_gateway : k => v.id }
-}
+                route_key = make_route_key(dest_cidr)
 
-output "network_function_attachment_ids" {
-  description = "Map of Network Function attachment keys to attachment IDs (from data source)"
-  value       = { for k, v in data.aws_ec2_transit_gateway_attachment.network_function : k => v.id }
-}
-"""
+                is_blackhole = route.get('State') == 'blackhole'
 
-            (tgw_dir / 'versions.tf').write_text(tgw_versions, encoding='utf-8')
-            (tgw_dir / 'main.tf').write_text(tgw_main, encoding='utf-8')
-            (tgw_dir / 'outputs.tf').write_text(tgw_outputs, encoding='utf-8')
-            print(f"✓ Generated: {tgw_dir / 'versions.tf'}")
-            print(f"✓ Generated: {tgw_dir / 'main.tf'}")
-            print(f"✓ Generated: {tgw_dir / 'outputs.tf'}")
+                route_entry = {
+                    'key': route_key,
+                    'destination_cidr_block': dest_cidr,
+                    'blackhole': is_blackhole
+                }
 
-            # Load route tables
-            tgw_rts_data = self.load_json('tgw-route-tables.json')
+                if not is_blackhole:
+                    # Find attachment
+                    for att_info in route.get('TransitGatewayAttachments', []):
+                        att_id = att_info.get('TransitGatewayAttachmentId')
+                        att = all_attachments.get(att_id)
+                        if att is not None:
+                            route_entry['attachment_key'] = att['key']
+                            route_entry['attachment_type'] = att['type']
+                            break
 
-            # Collect all attachments for this TGW
-            all_attachments = self.collect_all_attachments()
+                routes.append(route_entry)
+
+            # Generate locals.tf
+            locals_content = self.generate_route_table_locals(
+                rt_id, rt_name, rt_tags,
+                associations, propagations,
+                routes
+            )
+
+            # Write static files and locals.tf
+            rt_files = [
+                ('versions.tf', VERSIONS_TF_BYTES),
+                ('data.tf', data_tf_content),
+                ('main.tf', MAIN_TF_RT_BYTES),
+                ('locals.tf', locals_content),
+            ]
+            rt_root = os.fspath(rt_dir)  # Joined as a str for the four file paths
+            for filename, content in rt_files:
+                self.write_file(os.path.join(rt_root, filename), content)
+            generated.append(rt_dir / 'locals.tf')
+
+        return generated
 
-            # Process each route table belonging to this TGW
-            for rt in tgw_rts_data.get('TransitGatewayRouteTables', []):
-                rt_id = rt['TransitGatewayRouteTableId']
-                rt_tgw_id = rt.get('TransitGatewayId')
+    def generate_all_configs(self) -> None:
+        """Generate all configuration files for all Transit Gateways."""
+        # Load all Transit Gateways
+        tgws_data = self.load_json('transit-gateways.json')
+        tgws = tgws_data.get('TransitGateways', [])
 
-                # Skip route tables not belonging to this TGW
-                if rt_tgw_id != tgw_id:
-                    continue
+        if not tgws:
+            raise ValueError("No Transit Gateway found")
 
-                rt_name = self.get_tag_value(rt.get('Tags'), 'Name', rt_id)
-                rt_tags = {tag['Key']: tag['Value'] for tag in rt.get('Tags', []) if 'Key' in tag}
-
-                # Create route table directory
-                rt_dirname = self.sanitize_dirname(rt_name)
-                rt_dir = self.output_dir / f'{tgw_dirname}-rt-{rt_dirname}'
-                rt_dir.mkdir(parents=True, exist_ok=True)
-
-                # Update DATA_TF to reference the correct TGW directory
-                data_tf_content = DATA_TF.replace('../tgw/', f'../tgw-{tgw_dirname}/')
-
-                # Write static files
-                (rt_dir / 'versions.tf').write_text(VERSIONS_TF, encoding='utf-8')
-                (rt_dir / 'data.tf').write_text(data_tf_content, encoding='utf-8')
-                (rt_dir / 'main.tf').write_text(MAIN_TF_RT, encoding='utf-8')
-
-                # Collect associations
-                associations = []
-                assoc_file = self.input_dir / f'tgw-rt-associations-{rt_id}.json'
-                if assoc_file.exists():
-                    with open(assoc_file, 'r', encoding='utf-8') as f:
-                        assoc_data = json.load(f)
-                        for assoc in assoc_data.get('Associations', []):
-                            if assoc.get('State') != 'associated':
-                                continue
-                            att_id = assoc.get('TransitGatewayAttachmentId')
-                            if att_id in all_attachments:
-                                att = all_attachments[att_id]
-                                associations.append((att['key'], att['key'], att['type']))
-
-                # Collect propagations
-                propagations = []
-                prop_file = self.input_dir / f'tgw-rt-propagations-{rt_id}.json'
-                if prop_file.exists():
-                    with open(prop_file, 'r', encoding='utf-8') as f:
-                        prop_data = json.load(f)
-                        for prop in prop_data.get('TransitGatewayRouteTablePropagations', []):
-                            if prop.get('State') != 'enabled':
-                                continue
-                            att_id = prop.get('TransitGatewayAttachmentId')
-                            if att_id in all_attachments:
-                                att = all_attachments[att_id]
-                                propagations.append((att['key'], att['key'], att['type']))
-
-                # Collect routes
-                routes = []
-                routes_file = self.input_dir / f'tgw-rt-routes-{rt_id}.json'
-                if routes_file.exists():
-                    with open(routes_file, encoding='utf-8') as f:
-                        routes_data = json.load(f)
-                        for route in routes_data.get('Routes', []):
-                            if route.get('Type') == 'propagated':
-                                continue
-                            dest_cidr = route.get('DestinationCidrBlock', '')
-                            if not dest_cidr:
-                                continue
-
-                            dest_sanitized = dest_cidr.replace('/', '_').replace('.', '_').replace(':', '_')
-                            route_key = f'route_{dest_sanitized}'
-
-                            is_blackhole = route.get('State') == 'blackhole'
-
-                            route_entry = {
-                                'key': route_key,
-                                'destination_cidr_block': dest_cidr,
-                                'blackhole': is_blackhole
-                            }
-
-                            if not is_blackhole:
-                                # Find attachment
-                                for att_info in route.get('TransitGatewayAttachments', []):
-                                    att_id = att_info.get('TransitGatewayAttachmentId')
-                                    if att_id in all_attachments:
-                                        att = all_attachments[att_id]
-                                        route_entry['attachment_key'] = att['key']
-                                        route_entry['attachment_type'] = att['type']
-                                        break
-
-                            routes.append(route_entry)
-
-                # Collect attachments for this route table
-                rt_attachments = {}
-
-                # Add attachments from associations
-                for assoc_key, att_key, att_type in associations:
-                    for att_id, att in all_attachments.items():
-                        if att['key'] == att_key:
-                            rt_attachments[att_key] = att
-                            break
+        print(f"Found {len(tgws)} Transit Gateway(s)")
 
-                # Add attachments from propagations
-                for prop_key, att_key, att_type in propagations:
-                    for att_id, att in all_attachments.items():
-                        if att['key'] == att_key and att_key not in rt_attachments:
-                            rt_attachments[att_key] = att
-                            break
+        # Generate each TGW in turn so that parsed input files are shared
+        results = [self.generate_configs_for_tgw(tgw) for tgw in tgws]
 
-                # Add attachments from routes
-                for route in routes:
-                    if 'attachment_key' in route:
-                        att_key = route['attachment_key']
-                        for att_id, att in all_attachments.items():
-                            if att['key'] == att_key and att_key not in rt_attachments:
-                                rt_attachments[att_key] = att
-                                break
-
-                # Generate locals.tf
-                locals_content = self.generate_route_table_locals(
-                    rt_id, rt_name, rt_tags,
-                    rt_attachments,
-                    associations, propagations,
-                    routes
-                )
-                (rt_dir / 'locals.tf').write_text(locals_content, encoding='utf-8')
-                print(f"✓ Generated: {rt_dir / 'locals.tf'}")
+        # Report generated files in TGW order with a single write
+        report = []
+        for tgw, generated in zip(tgws, results):
+            tgw_id = tgw['TransitGatewayId']
+            tgw_name = self.tags_to_dict(tgw.get('Tags')).get('Name', tgw_id)
+            report.append(f"\nProcessing TGW: {tgw_name} ({tgw_id})\n")
+            report.extend(f"✓ Generated: {config_file}\n" for config_file in generated)
+        sys.stdout.write(''.join(report))
 
         print(f"\n✓ All configurations generated in: {self.output_dir}")
         print("\nNext steps:")
@@ -969,42 +1079,44 @@ output "network_function_attachment_ids" {
 
 def main():
     """Main entry point."""
-    import argparse
-    import os
-
-    parser = argparse.ArgumentParser(
-        description='Generate split Terraform configuration from existing AWS resources'
-    )
-    parser.add_argument(
-        '--input-dir',
-        default=DEFAULT_INPUT_DIR,
-        help=f'Directory containing AWS resource JSON files (default: {DEFAULT_INPUT_DIR})'
-    )
-    parser.add_argument(
-        '--output-dir',
-        default=DEFAULT_OUTPUT_DIR,
-        help=f'Output directory for Terraform configuration (default: {DEFAULT_OUTPUT_DIR})'
-    )
-    parser.add_argument(
-        '--account-id',
-        default=None,
-        help='AWS Account ID (auto-detected from input path if not specified)'
-    )
-    parser.add_argument(
-        '--region',
-        default=None,
-        help='AWS Region (auto-detected from input path if not specified)'
-    )
-
-    args = parser.parse_args()
+    if len(sys.argv) == 1:
+        # Without options, use the defaults and skip building the argument parser
+        input_dir, output_dir, account_id, region = DEFAULT_INPUT_DIR, DEFAULT_OUTPUT_DIR, None, None
+    else:
+        import argparse
+
+        parser = argparse.ArgumentParser(
+            description='Generate split Terraform configuration from existing AWS resources'
+        )
+        parser.add_argument(
+            '--input-dir',
+            default=DEFAULT_INPUT_DIR,
+            help=f'Directory containing AWS resource JSON files (default: {DEFAULT_INPUT_DIR})'
+        )
+        parser.add_argument(
+            '--output-dir',
+            default=DEFAULT_OUTPUT_DIR,
+            help=f'Output directory for Terraform configuration (default: {DEFAULT_OUTPUT_DIR})'
+        )
+        parser.add_argument(
+            '--account-id',
+            default=None,
+            help='AWS Account ID (auto-detected from input path if not specified)'
+        )
+        parser.add_argument(
+            '--region',
+            default=None,
+            help='AWS Region (auto-detected from input path if not specified)'
+        )
+
+        args = parser.parse_args()
+        input_dir, output_dir = args.input_dir, args.output_dir
+        account_id, region = args.account_id, args.region
 
     # Auto-detect account and region from input directory structure
     # Expected: ./output/{account_id}/{region}/
-    account_id = args.account_id
-    region = args.region
-
     if not account_id or not region:
-        input_path = Path(args.input_dir)
+        input_path = Path(input_dir)
         parts = input_path.parts
         if len(parts) >= 2:
             # Check if last two parts look like account_id/region
@@ -1016,7 +1128,7 @@ def main():
             if not account_id and potential_account and potential_account.isdigit():
                 account_id = potential_account
 
-    generator = TerraformConfigGeneratorV2(args.input_dir, args.output_dir, account_id, region)
+    generator = TerraformConfigGeneratorV2(input_dir, output_dir, account_id, region)
     generator.generate_all_configs()
 
 